@@ -0,0 +1,128 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _flow_and_spread(dollar_volume, is_call, last_price, bid, ask,
+                     spread_pct, volume, volume_threshold, spread_z_threshold):
+    """
+    Fused single-pass kernel over the options chain.
+
+    Computes bullish/bearish dollar-volume flow, the mean/std of
+    spread_percentage, and the unusual-spread mask in one sweep over the
+    raw arrays, with no intermediate DataFrames or temp columns.
+    """
+    n = dollar_volume.shape[0]
+    bullish = 0.0
+    bearish = 0.0
+    spread_sum = 0.0
+    spread_sq_sum = 0.0
+    valid_spreads = 0
+    for i in prange(n):
+        above_bid = last_price[i] > bid[i]
+        below_ask = last_price[i] < ask[i]
+        # Skip NaN dollar volume (untraded contracts) like pandas
+        # Series.sum() does, instead of poisoning the running totals
+        if dollar_volume[i] == dollar_volume[i]:
+            if (is_call[i] and above_bid) or (not is_call[i] and below_ask):
+                bullish += dollar_volume[i]
+            if (not is_call[i] and above_bid) or (is_call[i] and below_ask):
+                bearish += dollar_volume[i]
+        # Zero-quote contracts produce NaN spread_percentage (0/0); skip
+        # them so one dead contract doesn't zero out every detection the
+        # way the old scipy zscore did
+        if spread_pct[i] == spread_pct[i]:
+            spread_sum += spread_pct[i]
+            spread_sq_sum += spread_pct[i] * spread_pct[i]
+            valid_spreads += 1
+
+    mean = spread_sum / valid_spreads if valid_spreads > 0 else 0.0
+    variance = spread_sq_sum / valid_spreads - mean * mean if valid_spreads > 0 else 0.0
+    std = np.sqrt(variance) if variance > 0 else 0.0
+
+    # z > threshold is equivalent to spread_pct > mean + threshold * std,
+    # so compare against the cutoff directly instead of dividing per element
+    cutoff = mean + spread_z_threshold * std
+
+    unusual_mask = np.empty(n, np.bool_)
+    for i in prange(n):
+        unusual_mask[i] = std > 0 and spread_pct[i] > cutoff and volume[i] > volume_threshold
+
+    return bullish, bearish, unusual_mask
+
+
+def _flow_and_spread_numpy(dollar_volume, is_call, last_price, bid, ask,
+                           spread_pct, volume, volume_threshold, spread_z_threshold):
+    """Vectorized numpy fallback used when numba is not installed"""
+    above_bid = last_price > bid
+    below_ask = last_price < ask
+    # nansum matches the skip-NaN semantics of pandas Series.sum():
+    # untraded contracts come back from yfinance with NaN volume
+    bullish = np.nansum(dollar_volume[(is_call & above_bid) | (~is_call & below_ask)])
+    bearish = np.nansum(dollar_volume[(~is_call & above_bid) | (is_call & below_ask)])
+
+    # Mirror the jitted kernel: NaN spreads from zero-quote contracts
+    # are excluded rather than poisoning the mean/std
+    finite_spreads = spread_pct[spread_pct == spread_pct]
+    mean = finite_spreads.mean() if finite_spreads.size else 0.0
+    std = finite_spreads.std() if finite_spreads.size else 0.0
+    if std > 0:
+        cutoff = mean + spread_z_threshold * std
+        unusual_mask = (spread_pct > cutoff) & (volume > volume_threshold)
+    else:
+        unusual_mask = np.zeros(spread_pct.shape, np.bool_)
+
+    return bullish, bearish, unusual_mask
+
+
+def _rolling_std(values, window):
+    """
+    Single-pass rolling sample std via incremental sum/sum-of-squares.
+
+    O(N) instead of pandas' O(N*W) windowed path; matches
+    Series.rolling(window).std() including its NaN handling (a window is
+    only valid once it holds `window` non-NaN observations).
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    running_sum = 0.0
+    running_sq_sum = 0.0
+    valid = 0
+    for i in range(n):
+        value = values[i]
+        if value == value:  # not NaN
+            running_sum += value
+            running_sq_sum += value * value
+            valid += 1
+        if i >= window:
+            outgoing = values[i - window]
+            if outgoing == outgoing:
+                running_sum -= outgoing
+                running_sq_sum -= outgoing * outgoing
+                valid -= 1
+        if i >= window - 1 and valid == window:
+            mean = running_sum / window
+            variance = (running_sq_sum - window * mean * mean) / (window - 1)
+            out[i] = np.sqrt(variance) if variance > 0 else 0.0
+        else:
+            out[i] = np.nan
+    return out
+
+
+def _rolling_std_numpy(values, window):
+    """pandas fallback used when numba is not installed"""
+    import pandas as pd
+    return pd.Series(values).rolling(window).std().to_numpy()
+
+
+if NUMBA_AVAILABLE:
+    flow_and_spread = njit(cache=True, parallel=True)(_flow_and_spread)
+    rolling_std = njit(cache=True)(_rolling_std)
+else:
+    flow_and_spread = _flow_and_spread_numpy
+    rolling_std = _rolling_std_numpy
@@ -1,9 +1,11 @@
 import pandas as pd
 import numpy as np
 import yfinance as yf
-from scipy import stats
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dynamicThreshold import DynamicThresholdCalculator
+from _numba_kernels import flow_and_spread, rolling_std
 
 class OptionsDetector:
     def __init__(self, symbol, lookback_period=252):
@@ -11,13 +13,33 @@ class OptionsDetector:
         self.lookback_period = lookback_period
         self.thresholds = {}
         self.stock = yf.Ticker(symbol)
+        # Cache per-expiration chain fetches so repeated analysis passes
+        # share one network round-trip per expiration
+        self._fetch_chain = lru_cache(maxsize=None)(self.stock.option_chain)
+        # Memoized copies of the assembled chain and price history so the
+        # flow/spread/threshold methods don't re-fetch per report
+        self._chain_cache = None
+        self._hist_cache = None
+        self._fast_info = None
 
-    def initialize_dynamic_thresholds(self):
+    @property
+    def current_price(self):
+        """Latest traded price, fetched once via the lightweight fast_info endpoint"""
+        if self._fast_info is None:
+            self._fast_info = self.stock.fast_info
+        return float(self._fast_info['lastPrice'])
+
+    def initialize_dynamic_thresholds(self, historical_data=None, options_data=None):
         """
         Initialize dynamic thresholds based on current market conditions
+
+        Callers that already hold the historical/options DataFrames can
+        pass them in to avoid re-fetching.
         """
-        historical_data = self.get_historical_data()
-        options_data = self.analyze_options_chain()
+        if historical_data is None:
+            historical_data = self.get_historical_data()
+        if options_data is None:
+            options_data = self.analyze_options_chain()
         
         threshold_calculator = DynamicThresholdCalculator(historical_data, options_data)
         
@@ -38,21 +60,25 @@ class OptionsDetector:
         
     def get_historical_data(self):
         """Fetch historical price data"""
+        if self._hist_cache is not None:
+            return self._hist_cache
+
         end_date = datetime.now()
         start_date = end_date - timedelta(days=self.lookback_period)
-        
+
         historical_data = self.stock.history(
             start=start_date,
             end=end_date,
             interval='1d'
         )
+        self._hist_cache = historical_data
         return historical_data
 
     def analyze_price_movement(self, historical_data):
         """Analyze price movements and volatility"""
         historical_data['Returns'] = historical_data['Close'].pct_change()
         historical_data['Historical_Volatility'] = (
-            historical_data['Returns'].rolling(window=20).std() * np.sqrt(252)
+            rolling_std(historical_data['Returns'].to_numpy(dtype=np.float64), 20) * np.sqrt(252)
         )
         
         # Calculate price momentum
@@ -63,43 +89,171 @@ class OptionsDetector:
 
     def analyze_options_chain(self):
         """Enhanced options chain analysis"""
+        if self._chain_cache is not None:
+            return self._chain_cache
+
         all_options = []
         expirations = self.stock.options
 
-        for exp in expirations:
-            opt = self.stock.option_chain(exp)
-            
-            # Enhance calls data
-            calls = opt.calls
-            calls['type'] = 'call'
-            calls['expiration'] = exp
-            
-            # Enhance puts data
-            puts = opt.puts
-            puts['type'] = 'put'
-            puts['expiration'] = exp
-            
-            # Calculate spread metrics
-            calls['bid_ask_spread'] = calls['ask'] - calls['bid']
-            calls['spread_percentage'] = calls['bid_ask_spread'] / calls['ask'] * 100
-            puts['bid_ask_spread'] = puts['ask'] - puts['bid']
-            puts['spread_percentage'] = puts['spread_percentage'] = puts['bid_ask_spread'] / puts['ask'] * 100
-            
-            chain = pd.concat([calls, puts])
-            all_options.append(chain)
-            
-        return pd.concat(all_options)
+        # Each option_chain call is a blocking HTTPS round-trip, so fetch
+        # all expirations concurrently instead of serially
+        with ThreadPoolExecutor(max_workers=min(16, len(expirations))) as executor:
+            results = list(executor.map(self._fetch_chain, expirations))
+
+        for exp, opt in zip(expirations, results):
+            # Build each tagged frame in one constructor call from raw
+            # ndarrays: no per-column __setitem__ on the yfinance slice,
+            # no copy-on-write churn. 'type' stays categorical so the
+            # downstream == 'call' / == 'put' masks compare int8 codes.
+            for raw, option_type in ((opt.calls, 'call'), (opt.puts, 'put')):
+                ask = raw['ask'].to_numpy()
+                spread = ask - raw['bid'].to_numpy()
+                tagged = pd.DataFrame({
+                    **{column: raw[column].to_numpy() for column in raw.columns},
+                    'type': pd.Categorical([option_type] * len(raw), categories=['call', 'put']),
+                    'expiration': exp,
+                    'bid_ask_spread': spread,
+                    'spread_percentage': spread / ask * 100
+                }, copy=False)
+                # Defer all concatenation to the single concat below; a
+                # per-expiration concat would copy both halves N extra times
+                all_options.append(tagged)
+
+        chain = pd.concat(all_options, ignore_index=True, copy=False)
+
+        # Down-cast to float32: strikes, prices and IVs don't need double
+        # precision, and halving the column width halves the bytes moved
+        # by every downstream reduction. volume/openInterest stay float
+        # because yfinance reports them as NaN for untraded contracts.
+        for column in ('bid', 'ask', 'lastPrice', 'strike', 'impliedVolatility',
+                       'bid_ask_spread', 'spread_percentage', 'volume', 'openInterest'):
+            chain[column] = chain[column].astype('float32', copy=False)
+
+        self._chain_cache = chain
+        return self._chain_cache
+
+    def _iter_chains(self):
+        """Yield (expiration, calls, puts) per expiration as the fetches complete"""
+        expirations = self.stock.options
+        with ThreadPoolExecutor(max_workers=min(16, len(expirations))) as executor:
+            for exp, opt in zip(expirations, executor.map(self._fetch_chain, expirations)):
+                yield exp, opt.calls, opt.puts
+
+    def compute_all_metrics(self, historical_data=None):
+        """
+        Compute every options metric the report needs by streaming the
+        chain expiration by expiration.
+
+        The report only consumes scalar aggregates (per-type volume/OI
+        sums, flow totals, unusual-spread count, per-expiration skew), so
+        there is no need to concat the full chain first: accumulate
+        running totals as each expiration arrives. Only the three columns
+        needed for global statistics (spreads, volume, quotes) are kept,
+        so peak memory stays near one expiration instead of the whole chain.
+        """
+        atm_strike = self.current_price
+
+        call_volume = put_volume = 0.0
+        call_oi = put_oi = 0.0
+        bullish = bearish = 0.0
+        spread_parts, volume_parts, bid_parts, ask_parts = [], [], [], []
+        volatility_skew = {}
+
+        for exp, calls, puts in self._iter_chains():
+            exp_strikes, exp_ivs = [], []
+            for frame, is_call in ((calls, True), (puts, False)):
+                volume = frame['volume'].to_numpy(dtype=np.float64)
+                open_interest = frame['openInterest'].to_numpy(dtype=np.float64)
+                last_price = frame['lastPrice'].to_numpy(dtype=np.float64)
+                bid = frame['bid'].to_numpy(dtype=np.float64)
+                ask = frame['ask'].to_numpy(dtype=np.float64)
+
+                dollar_volume = volume * last_price * 100
+                above_bid = last_price > bid
+                below_ask = last_price < ask
+                if is_call:
+                    call_volume += np.nansum(volume)
+                    call_oi += np.nansum(open_interest)
+                    bullish += np.nansum(dollar_volume[above_bid])
+                    bearish += np.nansum(dollar_volume[below_ask])
+                else:
+                    put_volume += np.nansum(volume)
+                    put_oi += np.nansum(open_interest)
+                    bullish += np.nansum(dollar_volume[below_ask])
+                    bearish += np.nansum(dollar_volume[above_bid])
+
+                spread_parts.append((ask - bid) / ask * 100)
+                volume_parts.append(volume)
+                bid_parts.append(bid)
+                ask_parts.append(ask)
+                exp_strikes.append(frame['strike'].to_numpy(dtype=np.float64))
+                exp_ivs.append(frame['impliedVolatility'].to_numpy(dtype=np.float64))
+
+            volatility_skew[exp] = self._atm_iv(
+                np.concatenate(exp_strikes), np.concatenate(exp_ivs), atm_strike
+            )
+
+        spread_pct = np.concatenate(spread_parts)
+        volume = np.concatenate(volume_parts)
+
+        if not self.thresholds:
+            # The liquidity thresholds only look at quotes and volume, so
+            # a compact three-column frame stands in for the full chain
+            compact_chain = pd.DataFrame({
+                'bid': np.concatenate(bid_parts),
+                'ask': np.concatenate(ask_parts),
+                'volume': volume
+            })
+            self.initialize_dynamic_thresholds(
+                historical_data=historical_data, options_data=compact_chain
+            )
+
+        mean = np.nanmean(spread_pct)
+        std = np.nanstd(spread_pct)
+        cutoff = mean + self.thresholds['spread'] * std
+        unusual_count = int(((spread_pct > cutoff) & (volume > self.thresholds['volume'])).sum())
+
+        return {
+            'put_call_ratios': {
+                'volume_put_call_ratio': put_volume / call_volume if call_volume > 0 else 0,
+                'oi_put_call_ratio': put_oi / call_oi if call_oi > 0 else 0
+            },
+            'options_flow': {
+                'bullish_flow': bullish,
+                'bearish_flow': bearish,
+                'net_flow': bullish - bearish
+            },
+            'unusual_spreads_count': unusual_count,
+            'volatility_skew': volatility_skew
+        }
+
+    @staticmethod
+    def _atm_iv(strikes, ivs, atm_strike):
+        """Mean implied volatility of the two strikes nearest the ATM price"""
+        unique_strikes = np.unique(strikes)
+        if len(unique_strikes) < 2:
+            selected = unique_strikes
+        else:
+            pos = min(max(np.searchsorted(unique_strikes, atm_strike), 1), len(unique_strikes) - 1)
+            nearest = pos if unique_strikes[pos] - atm_strike < atm_strike - unique_strikes[pos - 1] else pos - 1
+            neighbours = [i for i in (nearest - 1, nearest + 1) if 0 <= i < len(unique_strikes)]
+            second = min(neighbours, key=lambda i: abs(unique_strikes[i] - atm_strike))
+            selected = unique_strikes[[nearest, second]]
+        return float(np.nanmean(ivs[np.isin(strikes, selected)]))
 
     def calculate_put_call_ratio(self, options_data):
         """Calculate put-call ratio metrics"""
-        call_volume = options_data[options_data['type'] == 'call']['volume'].sum()
-        put_volume = options_data[options_data['type'] == 'put']['volume'].sum()
-        
+        # Single groupby pass covers both volume and open interest instead
+        # of four boolean-masked column scans
+        totals = options_data.groupby('type', observed=True, sort=False)[['volume', 'openInterest']].sum()
+        call_volume = totals.loc['call', 'volume'] if 'call' in totals.index else 0
+        put_volume = totals.loc['put', 'volume'] if 'put' in totals.index else 0
+
         put_call_ratio = put_volume / call_volume if call_volume > 0 else 0
-        
-        call_oi = options_data[options_data['type'] == 'call']['openInterest'].sum()
-        put_oi = options_data[options_data['type'] == 'put']['openInterest'].sum()
-        
+
+        call_oi = totals.loc['call', 'openInterest'] if 'call' in totals.index else 0
+        put_oi = totals.loc['put', 'openInterest'] if 'put' in totals.index else 0
+
         put_call_oi_ratio = put_oi / call_oi if call_oi > 0 else 0
         
         return {
@@ -112,59 +266,76 @@ class OptionsDetector:
         Track and analyze options flow using dynamic thresholds
         """
         if not self.thresholds:
-            self.initialize_dynamic_thresholds()
-        
+            self.initialize_dynamic_thresholds(options_data=options_data)
+
         options_data['dollar_volume'] = options_data['volume'] * options_data['lastPrice'] * 100
-        
-        # Define dynamic thresholds for flow separation
-        volume_threshold = self.thresholds['volume']
-        
-        # Separate bullish and bearish flow
-        bullish_flow = options_data[
-            ((options_data['type'] == 'call') & (options_data['lastPrice'] > options_data['bid'])) |
-            ((options_data['type'] == 'put') & (options_data['lastPrice'] < options_data['ask']))
-        ]
-        bearish_flow = options_data[
-            ((options_data['type'] == 'put') & (options_data['lastPrice'] > options_data['bid'])) |
-            ((options_data['type'] == 'call') & (options_data['lastPrice'] < options_data['ask']))
-        ]
-        
+
+        # Single fused pass over raw ndarrays (numba-jitted when available)
+        # instead of materializing boolean-indexed DataFrame copies
+        bullish, bearish, _ = self._run_flow_kernel(options_data)
+
         return {
-            'bullish_flow': bullish_flow['dollar_volume'].sum(),
-            'bearish_flow': bearish_flow['dollar_volume'].sum(),
-            'net_flow': bullish_flow['dollar_volume'].sum() - bearish_flow['dollar_volume'].sum()
+            'bullish_flow': bullish,
+            'bearish_flow': bearish,
+            'net_flow': bullish - bearish
         }
 
+    def _run_flow_kernel(self, options_data):
+        """Extract raw arrays from the chain and run the fused flow/spread kernel"""
+        if 'dollar_volume' not in options_data:
+            options_data['dollar_volume'] = options_data['volume'] * options_data['lastPrice'] * 100
+
+        return flow_and_spread(
+            options_data['dollar_volume'].to_numpy(dtype=np.float64),
+            (options_data['type'] == 'call').to_numpy(),
+            options_data['lastPrice'].to_numpy(dtype=np.float64),
+            options_data['bid'].to_numpy(dtype=np.float64),
+            options_data['ask'].to_numpy(dtype=np.float64),
+            options_data['spread_percentage'].to_numpy(dtype=np.float64),
+            options_data['volume'].to_numpy(dtype=np.float64),
+            float(self.thresholds['volume']),
+            float(self.thresholds['spread'])
+        )
+
     def detect_unusual_spreads(self, options_data):
         """
         Detect unusual options spreads based on dynamic thresholds
         """
         if not self.thresholds:
-            self.initialize_dynamic_thresholds()
-        
-        # Calculate z-scores for spread metrics
-        options_data['spread_z_score'] = stats.zscore(options_data['spread_percentage'])
-        
-        # Identify unusual spreads using dynamic thresholds
-        unusual_spreads = options_data[
-            (options_data['spread_z_score'] > self.thresholds['spread']) & 
-            (options_data['volume'] > self.thresholds['volume'])
-        ]
-        
-        return unusual_spreads
+            self.initialize_dynamic_thresholds(options_data=options_data)
+
+        # The unusual-spread mask falls out of the same fused kernel pass
+        # that scores flow: z-score of spread_percentage vs the spread
+        # threshold, gated on the volume threshold
+        _, _, unusual_mask = self._run_flow_kernel(options_data)
+
+        return options_data[unusual_mask]
 
     def analyze_volatility_surface(self, options_data):
         """Analyze the volatility surface for anomalies"""
-        pivot_iv = pd.pivot_table(
-            options_data,
-            values='impliedVolatility',
-            index='strike',
-            columns='expiration'
+        # groupby + unstack builds the same strike x expiration matrix as
+        # pivot_table without the aggfunc dispatch machinery
+        pivot_iv = (
+            options_data
+            .groupby(['strike', 'expiration'], observed=True, sort=True)['impliedVolatility']
+            .mean()
+            .unstack('expiration')
         )
         
         # Calculate volatility skew
-        atm_strike = self.stock.info["currentPrice"]
-        closest_strikes = np.abs(pivot_iv.index - atm_strike).argsort()[:2]
+        atm_strike = self.current_price
+        # The strike index is sorted, so bisect for the ATM position in
+        # O(log K) instead of scanning/partitioning the whole axis, then
+        # pick the nearest strike and its closer neighbour
+        strikes = pivot_iv.index.to_numpy()
+        if len(strikes) < 2:
+            closest_strikes = list(range(len(strikes)))
+        else:
+            pos = min(max(np.searchsorted(strikes, atm_strike), 1), len(strikes) - 1)
+            nearest = pos if strikes[pos] - atm_strike < atm_strike - strikes[pos - 1] else pos - 1
+            neighbours = [i for i in (nearest - 1, nearest + 1) if 0 <= i < len(strikes)]
+            second = min(neighbours, key=lambda i: abs(strikes[i] - atm_strike))
+            closest_strikes = [nearest, second]
         
         volatility_skew = {
             exp: pivot_iv[exp].iloc[closest_strikes].mean() 
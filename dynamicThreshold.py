@@ -16,29 +16,36 @@ class DynamicThresholdCalculator:
         """
         Calculate dynamic thresholds based on historical volatility
         """
-        # Calculate daily returns and rolling volatility
-        returns = self.historical_data['Close'].pct_change()
-        rolling_vol = returns.rolling(window=20).std() * np.sqrt(252)
-        
-        # Calculate volatility regime
-        vol_percentile = rolling_vol.rank(pct=True).iloc[-1]
+        # Reuse the rolling volatility column when analyze_price_movement
+        # has already computed it; otherwise compute it here
+        if 'Historical_Volatility' in self.historical_data:
+            rolling_vol = self.historical_data['Historical_Volatility']
+        else:
+            returns = self.historical_data['Close'].pct_change()
+            rolling_vol = returns.rolling(window=20).std() * np.sqrt(252)
+
+        # Percentile of the latest vol reading via searchsorted on the
+        # sorted vector — O(N), no full rank(pct=True) series
+        vol_values = np.sort(rolling_vol.dropna().to_numpy())
+        last_vol = rolling_vol.iloc[-1]
+        vol_percentile = np.searchsorted(vol_values, last_vol, side='right') / len(vol_values)
         
         # Adjust thresholds based on volatility regime
         if vol_percentile > 0.8:  # High volatility regime
             return {
-                'price_move_threshold': rolling_vol.iloc[-1] * 0.5,  # Half daily vol
+                'price_move_threshold': last_vol * 0.5,  # Half daily vol
                 'volume_threshold': 2.5,  # More sensitive in high vol
                 'iv_threshold': 1.8
             }
         elif vol_percentile < 0.2:  # Low volatility regime
             return {
-                'price_move_threshold': rolling_vol.iloc[-1] * 1.5,  # 1.5x daily vol
+                'price_move_threshold': last_vol * 1.5,  # 1.5x daily vol
                 'volume_threshold': 4.0,  # Less sensitive in low vol
                 'iv_threshold': 2.5
             }
         else:  # Medium volatility regime
             return {
-                'price_move_threshold': rolling_vol.iloc[-1] * 1.0,  # 1x daily vol
+                'price_move_threshold': last_vol * 1.0,  # 1x daily vol
                 'volume_threshold': 3.0,
                 'iv_threshold': 2.0
             }
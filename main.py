@@ -1,7 +1,9 @@
+import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import json
+from concurrent.futures import ProcessPoolExecutor
 
 from detector import OptionsDetector
 from report import OptionsReport
@@ -75,17 +77,26 @@ def generate_readable_report(detector_obj: OptionsDetector, report_obj: OptionsR
         print(f"{threshold_name}: {value:.3f}")
     return interpretation
 
-def main():
-    ticker = "MSFT"
+def analyze_ticker(ticker):
+    """Run the full unusual-activity analysis for a single ticker"""
     detector = OptionsDetector(ticker)
     report = OptionsReport(detector)
-    
-    # Generate a comprehensive report
-    comprehensive_report = generate_readable_report(detector, report)
-    
+    return generate_readable_report(detector, report)
+
+def main():
+    tickers = ["MSFT"]
+
+    # Each ticker's analysis is independent, so fan out across processes:
+    # the pandas-heavy parts sidestep the GIL while the threaded yfinance
+    # fetches inside each worker overlap the network I/O
+    with ProcessPoolExecutor(max_workers=min(len(tickers), os.cpu_count())) as executor:
+        results = list(executor.map(analyze_ticker, tickers))
+
     # Visualize the analysis
     # fig = visualize_analysis(report)
     # plt.show()
 
+    return results
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
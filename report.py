@@ -16,37 +16,33 @@ class OptionsReport:
     def generate_comprehensive_report(self):
         """Generate a comprehensive analysis report"""
 
-        # Initialize dynamic thresholds
-        self.detector.initialize_dynamic_thresholds()
-
-        # Fetch and analyze all data
+        # Fetch and analyze price data
         historical_data = self.detector.get_historical_data()
         price_analysis = self.detector.analyze_price_movement(historical_data)
-        options_data = self.detector.analyze_options_chain()
-        
-        # Calculate all metrics
-        put_call_metrics = self.detector.calculate_put_call_ratio(options_data)
-        flow_metrics = self.detector.track_options_flow(options_data)
-        unusual_spreads = self.detector.detect_unusual_spreads(options_data)
-        volatility_skew = self.detector.analyze_volatility_surface(options_data)
-        
+
+        # Stream the options chain once, accumulating every options metric
+        # per expiration instead of materializing the full chain
+        options_metrics = self.detector.compute_all_metrics(historical_data=price_analysis)
+
+        # Pull all five last-row scalars in one columnar gather instead of
+        # going through the .iloc indexer per column
+        (current_price, daily_return, historical_volatility,
+         momentum_5d, momentum_20d) = price_analysis[
+            ['Close', 'Returns', 'Historical_Volatility', '5_day_momentum', '20_day_momentum']
+        ].to_numpy()[-1]
+
         # Compile report
         report = {
             'price_analysis': {
-                'current_price': historical_data['Close'].iloc[-1],
-                'daily_return': price_analysis['Returns'].iloc[-1],
-                'historical_volatility': price_analysis['Historical_Volatility'].iloc[-1],
-                '5_day_momentum': price_analysis['5_day_momentum'].iloc[-1],
-                '20_day_momentum': price_analysis['20_day_momentum'].iloc[-1]
+                'current_price': current_price,
+                'daily_return': daily_return,
+                'historical_volatility': historical_volatility,
+                '5_day_momentum': momentum_5d,
+                '20_day_momentum': momentum_20d
             },
-            'options_metrics': {
-                'put_call_ratios': put_call_metrics,
-                'options_flow': flow_metrics,
-                'unusual_spreads_count': len(unusual_spreads),
-                'volatility_skew': volatility_skew
-            }
+            'options_metrics': options_metrics
         }
-        
+
         return report
 
     def interpret_unusual_activity(self, report):